@@ -2,6 +2,7 @@
 # pylint: disable=import-error
 import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from collections import defaultdict
 from functools import partial
@@ -23,31 +24,39 @@ from homeassistant.helpers.dispatcher import dispatcher_send
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.event import track_time_interval
 from homeassistant.util.dt import utcnow
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 
-from miio import DeviceException
-from .fryer_miot import FryerMiot, FryerMiotYBAF, FryerMiotSCK, FryerMiotMi
+from .coordinator import FryerDataUpdateCoordinator
 
 from .const import (
     ATTR_MODE,
     ATTR_TIME,
     ATTR_RECIPE_ID,
     CONF_MODEL,
+    DATA_COORDINATOR,
+    DATA_DEVICE,
     DATA_KEY,
-    DATA_STATE,
     DOMAIN,
     DOMAINS,
     DEFAULT_SCAN_INTERVAL,
-    MODELS_CARELI,
-    MODELS_SILEN,
-    MODELS_MIOT,
+    MIIO_RETRY_COUNT,
+    MIIO_TIMEOUT,
     MODELS_ALL_DEVICES,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def determine_fryer_class(model: str):
+    """Return the device class handling the given model."""
+    # imported on first use, it pulls in python-miio
+    from .fryer_miot import FryerMiot  # pylint: disable=import-outside-toplevel
+
+    if model not in MODELS_ALL_DEVICES:
+        _LOGGER.error("Unsupported model %s, falling back to FryerMiot", model)
+    return FryerMiot
+
+
 async def async_setup(hass: HomeAssistant, hass_config: dict):
     """Set up the Xiaomi AirFryer Component."""
 
@@ -61,12 +70,11 @@ async def async_update_options(hass: HomeAssistant, entry: ConfigEntry):
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     """check unload integration"""
-    return all(
-        [
-            await hass.config_entries.async_forward_entry_unload(entry, domain)
-            for domain in DOMAINS
-        ]
-    )
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, DOMAINS)
+    if unload_ok:
+        hass.data[DOMAIN].pop(entry.entry_id)
+        hass.data.get(DATA_KEY, {}).pop(entry.entry_id, None)
+    return unload_ok
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
@@ -91,20 +99,33 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         model = entry.options.get(CONF_MODEL)
         scan_interval = entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
 
-    if DATA_KEY not in hass.data:
-        hass.data.setdefault(DATA_KEY, {})
-        hass.data[DATA_KEY][host] = {}
-
     if DOMAIN not in hass.data:
         hass.data[DOMAIN] = {}
 
-    fryer = FryerMiot(host, token, model=model)
-    hass.data[DOMAIN][host] = fryer
+    fryer_class = await hass.async_add_executor_job(determine_fryer_class, model)
+
+    # miIO is serial per device, keep its blocking calls off the shared executor
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"airfryer_{host}")
+    # also runs when setup fails or is retried
+    entry.async_on_unload(partial(executor.shutdown, wait=False))
+    fryer = fryer_class(
+        host,
+        token,
+        model=model,
+        executor=executor,
+        timeout=MIIO_TIMEOUT,
+        retry_count=MIIO_RETRY_COUNT,
+    )
+
+    coordinator = FryerDataUpdateCoordinator(hass, fryer, scan_interval)
+    await coordinator.async_config_entry_first_refresh()
+
+    hass.data[DOMAIN][entry.entry_id] = {
+        DATA_DEVICE: fryer,
+        DATA_COORDINATOR: coordinator,
+    }
 
     # init setup for each supported domains
-    for platform in DOMAINS:
-        hass.async_create_task(
-            hass.config_entries.async_forward_entry_setup(entry, platform)
-        )
+    await hass.config_entries.async_forward_entry_setups(entry, DOMAINS)
 
     return True
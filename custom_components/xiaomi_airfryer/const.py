@@ -6,14 +6,26 @@ DEFAULT_NAME = "Xiaomi AirFryer"
 DOMAIN = "xiaomi_airfryer"
 DOMAINS = ["sensor", "switch"]
 DATA_KEY = "xiaomi_airfryer_data"
-DATA_STATE = "state"
 DATA_DEVICE = "device"
+DATA_COORDINATOR = "coordinator"
 
 CONF_MODEL = "model"
 CONF_MAC = "mac"
 
 MODEL_FRYER_MAF01 = "careli.fryer.maf01"
 
+MODELS_CARELI = frozenset(
+    {
+        MODEL_FRYER_MAF01,
+        "careli.fryer.maf02",
+        "careli.fryer.maf03",
+        "careli.fryer.maf07",
+        "careli.fryer.ybaf01",
+    }
+)
+MODELS_SILEN = frozenset({"silen.fryer.sck501", "silen.fryer.sck505"})
+MODELS_ALL_DEVICES = MODELS_CARELI | MODELS_SILEN
+
 ATTR_FOOD_QUANTY = "food_quanty"
 ATTR_MODEL = "model"
 ATTR_MODE = "mode"
@@ -26,7 +38,16 @@ SUCCESS = ["ok"]
 
 DEFAULT_SCAN_INTERVAL = 30
 SCAN_INTERVAL = timedelta(seconds=30)
-MIN_TIME_BETWEEN_UPDATES = timedelta(seconds=1)
+ACTIVE_SCAN_INTERVAL = timedelta(seconds=10)
+COMMAND_ACTIVE_POLLS = 3
+FULL_REFRESH_INTERVAL = timedelta(seconds=60)
+# A poll makes at most two reads (hot, then full on a state transition), each
+# taking up to MIIO_TIMEOUT * (MIIO_RETRY_COUNT + 1) = 4 s, within UPDATE_TIMEOUT.
+# A re-handshake after a lost packet uses python-miio's own fixed discovery
+# timeout, which these values do not cover.
+UPDATE_TIMEOUT = 10
+MIIO_TIMEOUT = 2
+MIIO_RETRY_COUNT = 1
 
 SERVICE_START = "start"
 SERVICE_STOP = "stop"
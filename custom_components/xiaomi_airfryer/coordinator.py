@@ -0,0 +1,103 @@
+"""Data update coordinator of the Xiaomi AirFryer component."""
+# pylint: disable=import-error
+import asyncio
+import logging
+import time
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from miio import DeviceException
+from .const import (
+    ACTIVE_SCAN_INTERVAL,
+    COMMAND_ACTIVE_POLLS,
+    DOMAIN,
+    FULL_REFRESH_INTERVAL,
+    UPDATE_TIMEOUT,
+)
+
+if TYPE_CHECKING:
+    from .fryer_miot import FryerMiot, FryerStatusMiot
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class FryerDataUpdateCoordinator(DataUpdateCoordinator):
+    """Poll the fryer status, faster while it is cooking."""
+
+    def __init__(
+        self, hass: HomeAssistant, fryer: "FryerMiot", scan_interval: int
+    ) -> None:
+        """Initialize the coordinator."""
+        interval = timedelta(seconds=scan_interval)
+        self._fryer = fryer
+        # poll at the configured interval when idle, faster while cooking
+        self._active_interval = min(interval, ACTIVE_SCAN_INTERVAL)
+        self._idle_interval = interval
+        self._active_polls_left = 0
+        self._next_full_refresh = 0.0
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=interval,
+            # skip entity state writes when the polled status did not change
+            always_update=False,
+        )
+
+    def expect_state_change(self) -> None:
+        """Poll at the active interval for a while after a command.
+
+        The fryer does not report the new state immediately, so the refresh
+        right after a command may still see the old idle status.
+        """
+        self._active_polls_left = COMMAND_ACTIVE_POLLS
+        self.update_interval = self._active_interval
+
+    def request_full_refresh(self) -> None:
+        """Re-read all properties on the next poll, e.g. after a command."""
+        self._next_full_refresh = 0.0
+
+    def _read_status(self, previous: "FryerStatusMiot", full: bool):
+        """Blocking read of the status, returns (status, was_full_read)."""
+        if not full:
+            status = self._fryer.hot_status(previous)
+            # a state transition usually comes with new recipe settings
+            if status.data["status"] == previous.data["status"]:
+                return status, False
+        return self._fryer.status(), True
+
+    async def _async_fetch_status(self) -> "FryerStatusMiot":
+        """Read the hot properties, or all of them when the cache is stale."""
+        previous = self.data
+        full = previous is None or time.monotonic() >= self._next_full_refresh
+        # one executor job, so both reads are bounded by the same timeout
+        status, full = await self._fryer.async_call(self._read_status, previous, full)
+        if full:
+            self._next_full_refresh = (
+                time.monotonic() + FULL_REFRESH_INTERVAL.total_seconds()
+            )
+        return status
+
+    async def _async_update_data(self) -> "FryerStatusMiot":
+        """Fetch the fryer status once for all entities."""
+        # sized for the miIO reads, see UPDATE_TIMEOUT; polls never overlap
+        try:
+            async with asyncio.timeout(UPDATE_TIMEOUT):
+                status = await self._async_fetch_status()
+        except TimeoutError as ex:
+            raise UpdateFailed(
+                f"Timed out after {UPDATE_TIMEOUT}s polling device"
+            ) from ex
+        except DeviceException as ex:
+            raise UpdateFailed(f"Error communicating with device: {ex}") from ex
+
+        # the next refresh is scheduled with the interval set here
+        if status.is_on or self._active_polls_left > 0:
+            self.update_interval = self._active_interval
+        else:
+            self.update_interval = self._idle_interval
+        self._active_polls_left = max(self._active_polls_left - 1, 0)
+        return status
@@ -2,39 +2,109 @@
 Support for Xiaomi AirFryer.
 
 """
+import asyncio
 import enum
-from typing import Any, Dict, Tuple
+from concurrent.futures import Executor
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, Dict, NamedTuple, Tuple
 import logging
-import click
+import sys
 
-from miio.click_common import command, format_output
 from miio.device import DeviceStatus
 from miio.miot_device import MiotDevice
 
 _LOGGER = logging.getLogger(__name__)
 
+if "homeassistant" in sys.modules:
+    # Home Assistant never uses the python-miio CLI, skip building its commands
+
+    def command(*args, **kwargs):
+        """Return the method unchanged."""
+        return lambda func: func
+
+    def format_output(*args, **kwargs):
+        """Return no output template."""
+        return None
+
+    def argument(*args, **kwargs):
+        """Return no click argument."""
+        return None
+
+else:
+    from click import argument
+    from miio.click_common import command, format_output
+
+
+class _MiotProperty(NamedTuple):
+    """MIoT property address."""
+
+    siid: int
+    piid: int
+
+
+class _MiotAction(NamedTuple):
+    """MIoT action address."""
+
+    siid: int
+    aiid: int
+
 
 # http://miot-spec.org/miot-spec-v2/instance?type=urn:miot-spec-v2:device:air-fryer:0000A0A4:careli-maf01:1
-MIOT_MAPPING = {
-    "status": {"siid": 2, "piid": 1},  # read, notify
-    "device_fault": {"siid": 2, "piid": 2},  # read, notify
-    "target_time": {"siid": 2, "piid": 3},  # read, notify, write
-    "target_temperature": {"siid": 2, "piid": 4},  # read, notify, write
-    "left_time": {"siid": 2, "piid": 5},  # read, notify
-    "recipe_id": {"siid": 3, "piid": 1},  # read, notify, write
-    "recipe_name": {"siid": 3, "piid": 2},  # read, notify, write
-    "appoint_time": {"siid": 3, "piid": 5},  # read, notify, write
-    "food_quanty": {"siid": 3, "piid": 6},  # read, notify, write
-    "preheat_switch": {"siid": 3, "piid": 7},  # read, notify, write
-    "appoint_time_left": {"siid": 3, "piid": 8},  # read, notify, write
-    "recipe_sync": {"siid": 3, "piid": 9},  # read, notify, write
-    "turn_pot": {"siid": 3, "piid": 10},  # read, notify, write
-    "start_cook": {"siid": 2, "aiid": 1},
-    "cancel_cooking": {"siid": 2, "aiid": 2},
-    "pause": {"siid": 2, "aiid": 3},
-    "start_custom_cook": {"siid": 3, "aiid": 1},
-    "resume_cooking": {"siid": 3, "aiid": 2},
-}
+MIOT_MAPPING = MappingProxyType(
+    {
+        "status": _MiotProperty(2, 1),  # read, notify
+        "device_fault": _MiotProperty(2, 2),  # read, notify
+        "target_time": _MiotProperty(2, 3),  # read, notify, write
+        "target_temperature": _MiotProperty(2, 4),  # read, notify, write
+        "left_time": _MiotProperty(2, 5),  # read, notify
+        "recipe_id": _MiotProperty(3, 1),  # read, notify, write
+        "recipe_name": _MiotProperty(3, 2),  # read, notify, write
+        "appoint_time": _MiotProperty(3, 5),  # read, notify, write
+        "food_quanty": _MiotProperty(3, 6),  # read, notify, write
+        "preheat_switch": _MiotProperty(3, 7),  # read, notify, write
+        "appoint_time_left": _MiotProperty(3, 8),  # read, notify, write
+        "recipe_sync": _MiotProperty(3, 9),  # read, notify, write
+        "turn_pot": _MiotProperty(3, 10),  # read, notify, write
+        "start_cook": _MiotAction(2, 1),
+        "cancel_cooking": _MiotAction(2, 2),
+        "pause": _MiotAction(2, 3),
+        "start_custom_cook": _MiotAction(3, 1),
+        "resume_cooking": _MiotAction(3, 2),
+    }
+)
+
+# Readable properties only; actions (aiid) must not be sent in get_properties
+_PROP_MAPPING = MappingProxyType(
+    {k: v for k, v in MIOT_MAPPING.items() if isinstance(v, _MiotProperty)}
+)
+_PROP_REQUEST = [{"did": k, **v._asdict()} for k, v in _PROP_MAPPING.items()]
+
+# Properties that only change when a recipe or setting is applied, not while
+# cooking; they are re-read periodically rather than on every poll
+_COLD_PROPS = frozenset(
+    {
+        "recipe_id",
+        "recipe_name",
+        "appoint_time",
+        "food_quanty",
+        "preheat_switch",
+        "recipe_sync",
+        "turn_pot",
+    }
+)
+_HOT_PROP_REQUEST = [prop for prop in _PROP_REQUEST if prop["did"] not in _COLD_PROPS]
+
+_get_did_value_code = itemgetter("did", "value", "code")
+
+
+def _parse_properties(response: list) -> Dict[str, Any]:
+    """Map a get_properties response to {name: value}, None for failed reads."""
+    result = {}
+    for prop in response:
+        did, value, code = _get_did_value_code(prop)
+        result[did] = value if code == 0 else None
+    return result
 
 
 class DeviceException(Exception):
@@ -129,6 +199,12 @@ class RecipeToCommand(enum.Enum):
     Yogurt = ["M7", "", 480, 40, 0, 0, 0]
 
 
+# Serialized start_custom_cook payload keyed by recipe id
+_MODE_COMMANDS = {
+    recipe.value[0]: ",".join(map(str, recipe.value)) for recipe in RecipeToCommand
+}
+
+
 class RecipeName(enum.Enum):
     Manual = "Ручной"
     FrenchFries = "Картофель Фри"
@@ -140,101 +216,106 @@ class RecipeName(enum.Enum):
     Cake = "Торт"
 
 
+# Shutdown, Standby, Cooked and Pause2 count as off
+_OFF_STATES = frozenset({0, 1, 6, 9})
+
+# Raw property value -> enum member, avoiding Enum(value) scans and exceptions
+_STATUS_LOOKUP = {member.value: member for member in Status}
+_DEVICE_FAULT_LOOKUP = {member.value: member for member in DeviceFault}
+_FOOD_QUANTY_LOOKUP = {member.value: member for member in FoodQuanty}
+_PREHEAT_SWITCH_LOOKUP = {member.value: member for member in PreheatSwitch}
+_TURN_POT_LOOKUP = {member.value: member for member in TurnPot}
+# Status attributes returned as reported, without any decoding
+_PASSTHROUGH = frozenset(
+    {
+        "mode",
+        "target_time",
+        "target_temperature",
+        "left_time",
+        "recipe_id",
+        "appoint_time",
+        "appoint_time_left",
+    }
+)
+_RECIPE_ID_TO_NAME = {
+    recipe.value: RecipeName[recipe.name].value for recipe in RecipeId
+}
+
+
 class FryerStatusMiot(DeviceStatus):
     """Container for status reports for Xiaomi FryerStatusMiot."""
 
+    __slots__ = ("data",)
+
     def __init__(self, data: Dict[str, Any]) -> None:
         self.data = data
 
+    def __eq__(self, other: object) -> bool:
+        """Compare the raw property values, not the instance identity."""
+        if not isinstance(other, FryerStatusMiot):
+            return NotImplemented
+        return self.data == other.data
+
+    def __getattr__(self, name: str) -> Any:
+        """Return raw values of the attributes that need no decoding."""
+        if name in _PASSTHROUGH:
+            return self.data.get(name)
+        raise AttributeError(name)
+
     @property
     def is_on(self) -> bool:
         """True if device is currently on."""
-        return self.data["status"] not in [0, 1, 6, 9]
-
-    @property
-    def mode(self) -> int:
-        """Mode."""
-        return self.data.get("mode")
+        return self.data["status"] not in _OFF_STATES
 
     @property
     def status(self) -> int:
         """Operation status."""
-        try:
-            return Status(self.data["status"]).value
-        except ValueError:
+        member = _STATUS_LOOKUP.get(self.data["status"])
+        if member is None:
             _LOGGER.error("Unknown Status (%s)", self.data["status"])
             return Status.Unknown.value
+        return member.value
 
     @property
     def device_fault(self) -> int:
         """Device Fault."""
-        try:
-            return DeviceFault(self.data["device_fault"]).value
-        except ValueError:
+        member = _DEVICE_FAULT_LOOKUP.get(self.data["device_fault"])
+        if member is None:
             _LOGGER.error("Unknown Device Fault (%s)", self.data["device_fault"])
             return DeviceFault.Unknown.value
-
-    @property
-    def target_time(self) -> int:
-        """Target Time."""
-        return self.data["target_time"]
-
-    @property
-    def target_temperature(self) -> int:
-        """Target Temperature."""
-        return self.data["target_temperature"]
-
-    @property
-    def left_time(self) -> int:
-        """Left Time."""
-        return self.data["left_time"]
-
-    @property
-    def recipe_id(self) -> str:
-        """Recipe ID."""
-        return self.data["recipe_id"]
+        return member.value
 
     @property
     def recipe_name(self) -> str:
         """Recipe name."""
-        return RecipeName(RecipeId(self.data["recipe_id"]).name).value
-
-    @property
-    def appoint_time(self) -> int:
-        """Appoint Time"""
-        return self.data["appoint_time"]
+        return _RECIPE_ID_TO_NAME.get(self.data["recipe_id"], "Unknown")
 
     @property
     def food_quanty(self) -> FoodQuanty:
         """Food Quanty."""
-        try:
-            return FoodQuanty(self.data["food_quanty"])
-        except ValueError:
+        member = _FOOD_QUANTY_LOOKUP.get(self.data["food_quanty"])
+        if member is None:
             _LOGGER.error("Unknown FoodQuanty (%s)", self.data["food_quanty"])
             return FoodQuanty.Single
+        return member
 
     @property
     def preheat_switch(self) -> int:
         """Preheat Switch"""
-        try:
-            return PreheatSwitch(self.data["preheat_switch"]).value
-        except ValueError:
+        member = _PREHEAT_SWITCH_LOOKUP.get(self.data["preheat_switch"])
+        if member is None:
             _LOGGER.error("Unknown PreheatSwitch (%s)", self.data["preheat_switch"])
             return PreheatSwitch.Unknown.value
-
-    @property
-    def appoint_time_left(self) -> int:
-        """Appoint Time"""
-        return self.data["appoint_time_left"]
+        return member.value
 
     @property
     def turn_pot(self) -> TurnPot:
         """Turn Pot"""
-        try:
-            return TurnPot(self.data["turn_pot"])
-        except ValueError:
+        member = _TURN_POT_LOOKUP.get(self.data["turn_pot"])
+        if member is None:
             _LOGGER.error("Unknown TurnPot (%s)", self.data["turn_pot"])
             return TurnPot.Unknown
+        return member
 
 
 class FryerMiot(MiotDevice):
@@ -250,9 +331,48 @@ class FryerMiot(MiotDevice):
         debug: int = 0,
         lazy_discover: bool = True,
         model: str = "careli.fryer.maf02",
+        executor: Executor = None,
+        timeout: int = None,
+        retry_count: int = 3,
     ) -> None:
-        super().__init__(ip, token, start_id, debug, lazy_discover)
+        super().__init__(ip, token, start_id, debug, lazy_discover, timeout)
         self._model = model
+        self._executor = executor
+        self._max_retries = retry_count
+
+    def send(
+        self, command: str, parameters: Any = None, retry_count: int = None, **kwargs
+    ):
+        """Send a command, retrying at most the configured number of times."""
+        if retry_count is None:
+            retry_count = self._max_retries
+        return super().send(command, parameters, retry_count, **kwargs)
+
+    async def async_call(self, func, *args):
+        """Run a blocking device method in the device executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    def set_property(self, property_key: str, value):
+        """Set a property by name, resolving siid/piid from MIOT_MAPPING."""
+        siid, piid = MIOT_MAPPING[property_key]
+        return self.send(
+            "set_properties",
+            [{"did": property_key, "siid": siid, "piid": piid, "value": value}],
+        )
+
+    def call_action(self, name: str, params=None):
+        """Call an action by name, resolving siid/aiid from MIOT_MAPPING."""
+        siid, aiid = MIOT_MAPPING[name]
+        return self.call_action_by(siid, aiid, params)
+
+    def get_properties_for_mapping(self, *, max_properties=15) -> list:
+        """Retrieve all readable properties, using the prebuilt request list."""
+        return self.get_properties(
+            _PROP_REQUEST,
+            property_getter="get_properties",
+            max_properties=max_properties,
+        )
 
     @command(
         default_output=format_output(
@@ -272,15 +392,19 @@ class FryerMiot(MiotDevice):
     )
     def status(self) -> FryerStatusMiot:
         """Retrieve properties."""
-        return FryerStatusMiot(
-            {
-                prop["did"]: prop["value"] if prop["code"] == 0 else None
-                for prop in self.get_properties_for_mapping()
-            }
+        return FryerStatusMiot(_parse_properties(self.get_properties_for_mapping()))
+
+    def hot_status(self, previous: FryerStatusMiot) -> FryerStatusMiot:
+        """Refresh the frequently changing properties of a previous status."""
+        response = self.get_properties(
+            _HOT_PROP_REQUEST, property_getter="get_properties"
         )
+        data = dict(previous.data)
+        data.update(_parse_properties(response))
+        return FryerStatusMiot(data)
 
     @command(
-        click.argument("hours", type=int),
+        argument("hours", type=int),
         default_output=format_output("Setting appoint time to {hours} hours"),
     )
     def appoint_time(self, hours: int):
@@ -291,7 +415,7 @@ class FryerMiot(MiotDevice):
         return self.set_property("appoint_time", hours)
 
     @command(
-        click.argument("recipe_id", type=str),
+        argument("recipe_id", type=str),
         default_output=format_output("Setting recipe id to {recipe_id}"),
     )
     def recipe_id(self, recipe_id: str):
@@ -299,7 +423,7 @@ class FryerMiot(MiotDevice):
         return self.set_property("recipe_id", recipe_id)
 
     @command(
-        click.argument("food_quanty", type=int),
+        argument("food_quanty", type=int),
         default_output=format_output("Setting food quanty to {food_quanty}"),
     )
     def food_quanty(self, food_quanty: int):
@@ -309,7 +433,7 @@ class FryerMiot(MiotDevice):
         return self.set_property("food_quanty", food_quanty)
 
     @command(
-        click.argument("target_time", type=int),
+        argument("target_time", type=int),
         default_output=format_output("Setting target time to {target_time}"),
     )
     def target_time(self, target_time: int):
@@ -319,7 +443,7 @@ class FryerMiot(MiotDevice):
         return self.set_property("target_time", target_time)
 
     @command(
-        click.argument("target_temperature", type=int),
+        argument("target_temperature", type=int),
         default_output=format_output(
             "Setting target temperature to {target_temperature}"
         ),
@@ -350,9 +474,10 @@ class FryerMiot(MiotDevice):
     @command()
     def start_custom_cook(self, mode) -> None:
         """Start custom cook"""
-        recipe_id = RecipeId(mode)
-        command = RecipeToCommand[recipe_id.name].value
-        mode_command = ",".join([str(x) for x in command])
+        try:
+            mode_command = _MODE_COMMANDS[mode]
+        except KeyError as ex:
+            raise DeviceException("Invalid value for mode: %s" % mode) from ex
         return self.call_action("start_custom_cook", mode_command)
 
     @command()
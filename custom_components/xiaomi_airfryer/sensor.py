@@ -4,8 +4,6 @@ import asyncio
 import logging
 from enum import Enum
 from typing import Optional
-from datetime import timedelta
-from .const import MIN_TIME_BETWEEN_UPDATES
 from homeassistant.components.sensor import ENTITY_ID_FORMAT, SensorEntity
 from homeassistant.components.sensor.const import SensorDeviceClass
 from homeassistant.config_entries import SOURCE_IMPORT
@@ -20,20 +18,18 @@ from homeassistant.const import (
     UnitOfTemperature,
     UnitOfTime,
 )
-from homeassistant.util import Throttle
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from miio import Device, DeviceException
 from .const import (
     CONF_MODEL,
+    DATA_COORDINATOR,
     DATA_KEY,
-    DATA_STATE,
     DOMAIN,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
-SCAN_INTERVAL = timedelta(seconds=10)
-
 SENSOR_TYPES_MAF = {
     "status": ["Status", None, "status", None, "mdi:bowl", None],
     "target_time": [
@@ -144,19 +140,19 @@ async def async_setup_entry(hass, config, async_add_devices, discovery_info=None
             raise PlatformNotReady from ex
 
     sensors = []
-    fryer = hass.data[DOMAIN][host]
+    coordinator = hass.data[DOMAIN][config.entry_id][DATA_COORDINATOR]
     for stype in SENSOR_TYPES_MAF.values():
-        sensors.append(XiaomiAirFryerSensor(fryer, host, stype, config))
+        sensors.append(XiaomiAirFryerSensor(coordinator, host, stype, config))
 
     async_add_devices(sensors, update_before_add=False)
 
 
-class XiaomiAirFryerSensor(SensorEntity):
+class XiaomiAirFryerSensor(CoordinatorEntity, SensorEntity):
     """Xiaomi AirFryer Sensor"""
 
-    def __init__(self, device, host, config, entry):
+    def __init__(self, coordinator, host, config, entry):
         """Initialize sensor."""
-        self._device = device
+        super().__init__(coordinator)
         self._host = host
         self._model = entry.options.get(CONF_MODEL)
         self._mac = entry.options[CONF_MAC]
@@ -168,9 +164,6 @@ class XiaomiAirFryerSensor(SensorEntity):
         self._attr_native_unit_of_measurement = config[3]
         self._icon = config[4]
         self._attr_device_class = config[5]
-        self._state = None
-        self._retry = 0
-        self._retries = 3
         self._attr_unique_id = "{}.{}-{}".format(
             DOMAIN, entry.unique_id, self._attr_name.lower().replace(" ", "-")
         )
@@ -194,47 +187,20 @@ class XiaomiAirFryerSensor(SensorEntity):
 
         return device_info
 
-    @Throttle(MIN_TIME_BETWEEN_UPDATES)
-    async def async_update(self):
-        """Fetch state from the device."""
-        # On state change the device doesn't provide the new state immediately.
-        try:
-            state = self.hass.data[DATA_KEY][self._host].get(DATA_STATE, None)
-
-            if self._child is not None:
-                state = getattr(state, self._child, None)
-                # Unset state if child attribute isn't available anymore
-                if state is None:
-                    self._state = None
-
-            if state is not None:
-                value = getattr(state, self._attr, None)
-                if isinstance(value, Enum):
-                    self._state = value.name
-                else:
-                    self._state = value
-
-            self.async_schedule_update_ha_state()
-
-        except DeviceException as ex:
-            self._retry = self._retry + 1
-            if self._retry < self._retries:
-                _LOGGER.info(
-                    "Got exception while fetching the state: %s , _retry=%s",
-                    ex,
-                    self._retry,
-                )
-            else:
-                _LOGGER.error(
-                    "Got exception while fetching the state: %s , _retry=%s",
-                    ex,
-                    self._retry,
-                )
-
     @property
     def state(self):
         """Return the state."""
-        return self._state
+        state = self.coordinator.data
+        if self._child is not None:
+            # Unset state if child attribute isn't available anymore
+            state = getattr(state, self._child, None)
+        if state is None:
+            return None
+
+        value = getattr(state, self._attr, None)
+        if isinstance(value, Enum):
+            return value.name
+        return value
 
     @property
     def icon(self) -> Optional[str]:
@@ -2,9 +2,7 @@
 # pylint: disable=import-error
 import asyncio
 import logging
-from datetime import timedelta
 
-from miio import DeviceException
 import voluptuous as vol
 
 from homeassistant.components.switch import (
@@ -24,6 +22,7 @@ from homeassistant.const import (
 )
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import slugify
 from homeassistant.components.xiaomi_miio.const import (
     CONF_FLOW_TYPE,
@@ -37,12 +36,11 @@ from .const import (
     ATTR_TARGET_TEMPERATURE,
     ATTR_TARGET_TIME,
     CONF_MODEL,
-    DATA_STATE,
+    DATA_COORDINATOR,
     DATA_DEVICE,
     DATA_KEY,
     DEFAULT_NAME,
     DOMAIN,
-    MODELS_CARELI,
     MODELS_ALL_DEVICES,
     SERVICE_APPOINT_TIME,
     SERVICE_FOOD_QUANTY,
@@ -58,19 +56,18 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
-SCAN_INTERVAL = timedelta(seconds=30)
-
 DEFAULT_NAME = DEFAULT_NAME + " Switch"
 
-MODE = {"Standby": 1, "Appointment": 3, "Cooking": 4}
-
-MODE_MAF = {
-    "Standby": 1,
-    "Appointment": 3,
-    "Cooking": 4,
-    "Preheat": 5,
-    "Cooked": 6,
-    "PreheatFinish": 7,
+# start_custom mode -> recipe id, see RecipeId in fryer_miot
+RECIPE_MODES = {
+    "Manual": "M0",
+    "FrenchFries": "M1",
+    "ChickenWing": "M2",
+    "SweetPotato": "M3",
+    "Cake": "M4",
+    "Defrost": "M5",
+    "DriedFruit": "M6",
+    "Yogurt": "M7",
 }
 
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
@@ -90,18 +87,7 @@ SERVICE_SCHEMA = vol.Schema({vol.Optional(ATTR_ENTITY_ID): cv.entity_ids})
 
 SERVICE_SCHEMA_START_CUSTOM = SERVICE_SCHEMA.extend(
     {
-        vol.Required(ATTR_MODE): vol.All(
-            vol.In(
-                [
-                    "Standby",
-                    "Appointment",
-                    "Cooking",
-                    "Preheat",
-                    "Cooked",
-                    "PreheatFinish",
-                ]
-            )
-        )
+        vol.Required(ATTR_MODE): vol.All(vol.In(RECIPE_MODES))
     }
 )
 
@@ -186,10 +172,12 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
             hass.data[DATA_KEY] = {}
 
         if model in MODELS_ALL_DEVICES:
-            fryer = hass.data[DOMAIN][host]
-            device = XiaomiAirFryer(name, fryer, config_entry, unique_id)
+            data = hass.data[DOMAIN][config_entry.entry_id]
+            device = XiaomiAirFryer(
+                name, data[DATA_DEVICE], data[DATA_COORDINATOR], config_entry, unique_id
+            )
             entities.append(device)
-            hass.data[DATA_KEY][host][DATA_DEVICE] = device
+            hass.data[DATA_KEY][config_entry.entry_id] = {DATA_DEVICE: device}
         else:
             _LOGGER.error(
                 "Unsupported device found! Please create an issue at "
@@ -238,15 +226,13 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
     async_add_entities(entities, update_before_add=False)
 
 
-class XiaomiAirFryer(SwitchEntity):
+class XiaomiAirFryer(CoordinatorEntity, SwitchEntity):
     """Representation of a Xiaomi AirFryer."""
 
-    def __init__(self, name, device, entry, unique_id):
+    def __init__(self, name, device, coordinator, entry, unique_id):
         """Initialize the AirFryer."""
-        super().__init__()
+        super().__init__(coordinator)
 
-        self._available = False
-        self._state = None
         self._device = device
         self._host = entry.options[CONF_HOST]
         self._attr_name = name
@@ -258,7 +244,6 @@ class XiaomiAirFryer(SwitchEntity):
         self._mac = entry.options[CONF_MAC]
         self._state_attrs = {ATTR_MODEL: self._model}
         self._device_features = FEATURE_FLAGS_GENERIC
-        self._skip_update = False
 
         self.entity_id = ENTITY_ID_FORMAT.format("{}_{}".format(DOMAIN, slugify(name)))
 
@@ -267,11 +252,6 @@ class XiaomiAirFryer(SwitchEntity):
         """Return the icon to use for device if any."""
         return "mdi:pot-mix"
 
-    @property
-    def available(self):
-        """Return true when state is known."""
-        return self._available
-
     @property
     def extra_state_attributes(self):
         """Return the state attributes of the device."""
@@ -280,7 +260,9 @@ class XiaomiAirFryer(SwitchEntity):
     @property
     def is_on(self):
         """Return true if switch is on."""
-        return self._state
+        if self.coordinator.data is None:
+            return None
+        return self.coordinator.data.is_on
 
     @property
     def device_info(self):
@@ -297,83 +279,63 @@ class XiaomiAirFryer(SwitchEntity):
 
         return device_info
 
+    async def _async_call(self, func, *args):
+        """Run a blocking miIO command in the device executor."""
+        result = await self._device.async_call(func, *args)
+        self.coordinator.expect_state_change()
+        self.coordinator.request_full_refresh()
+        return result
+
     async def async_turn_on(self, **kwargs):
         """Turn the air fryeron."""
-        result = self._device.start_cook()
+        result = await self._async_call(self._device.start_cook)
 
         if result:
-            self._state = True
-            self._skip_update = True
+            await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs):
         """Turn the air fryer off."""
-        result = self._device.cancel_cooking()
+        result = await self._async_call(self._device.cancel_cooking)
 
         if result:
-            self._state = False
-            self._skip_update = True
+            await self.coordinator.async_request_refresh()
 
     async def async_start(self):
         """Start cooking."""
-        self._device.start_cook()
+        await self._async_call(self._device.start_cook)
 
     async def async_stop(self):
         """Stop cooking."""
-        self._device.cancel_cooking()
+        await self._async_call(self._device.cancel_cooking)
 
     async def async_pause(self):
         """Pause cooking."""
-        self._device.pause()
+        await self._async_call(self._device.pause)
 
     async def async_resume(self):
         """Resume cooking."""
-        self._device.resume_cooking()
+        await self._async_call(self._device.resume_cooking)
 
     async def async_start_custom(self, mode: str):
         """Start custom cooking."""
-        if self._model in MODELS_CARELI:
-            self._device.start_custom_cook(MODE_MAF[mode])
-        else:
-            self._device.start_custom_cook(MODE[mode])
+        await self._async_call(self._device.start_custom_cook, RECIPE_MODES[mode])
 
     async def async_food_quanty(self, food_quanty: int):
         """Set food quanty."""
-        self._device.food_quanty(food_quanty)
+        await self._async_call(self._device.food_quanty, food_quanty)
 
     async def async_recipe_id(self, recipe_id: str):
         """Set recipe id."""
-        self._device.recipe_id(recipe_id)
+        await self._async_call(self._device.recipe_id, recipe_id)
 
     async def async_appoint_time(self, time: int):
         """Set appoint time."""
-        self._device.appoint_time(time)
+        await self._async_call(self._device.appoint_time, time)
 
     async def async_target_time(self, target_time: int):
         """Set target time."""
-        self._device.target_time(target_time)
+        await self._async_call(self._device.target_time, target_time)
 
     async def async_target_temperature(self, target_temperature: int):
         """Set target temperature."""
-        self._device.target_temperature(target_temperature)
-
-    async def async_update(self):
-        """Fetch state from the device."""
-        # On state change the device doesn't provide the new state immediately.
-        if self._skip_update:
-            self._skip_update = False
-            return
-
-        try:
-            state = await self.hass.async_add_executor_job(self._device.status)
-            _LOGGER.debug("Got new state: %s", state)
-            self.hass.data[DATA_KEY][self._host][DATA_STATE] = state
-
-            if state is not None:
-                self._available = True
-                self._state = state.is_on
-
-            self.async_schedule_update_ha_state()
-        except DeviceException as ex:
-            if self._available:
-                self._available = False
-                _LOGGER.error("Got exception while fetching the state: %s", ex)
+        await self._async_call(self._device.target_temperature, target_temperature)